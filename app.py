@@ -2,6 +2,13 @@ import pandas as pd
 import streamlit as st
 from datetime import datetime
 import time
+import os
+import html
+import csv
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pv
+import pyarrow.parquet as pq
 # Set Streamlit page configuration
 st.set_page_config(
     page_title="AI Research at a Glance: arXiv Paper Overviews",
@@ -325,20 +332,205 @@ Title,Authors,Link,Description,PDF Link,HTML Link,Category,Date
 "Paper 6","Author F","http://example.com/6","Description of paper 6","http://example.com/pdf6","http://example.com/html6","AI","09-10-2024"
 '''
 
+# Define the required columns with their default values
+required_columns = {
+    'Title': '',
+    'Authors': 'Unknown',
+    'Link': '#',
+    'Description': 'No description available',
+    'PDF Link': '#',        # Default to empty link if missing
+    'HTML Link': '#',       # Default to empty link if missing
+    'Category': 'Uncategorized',  # Default to 'Uncategorized' if missing
+    'Date': pd.NaT          # Default to NaT if missing
+}
+
+# Format of the 'Date' column in the CSV data
+date_format = '%d-%m-%Y'
+
+# Maximum number of words shown in a card's description
+max_description_words = 200
+
+# Column types for the CSV loader, so Arrow can skip type inference
+column_types = {
+    'Title': pa.string(),
+    'Authors': pa.string(),
+    'Link': pa.string(),
+    'Description': pa.string(),
+    'PDF Link': pa.string(),
+    'HTML Link': pa.string(),
+    'Category': pa.dictionary(pa.int32(), pa.string()),  # Becomes a pandas category column
+    'Date': pa.timestamp('ns')
+}
+
+def prepare_data(df):
+    """
+    Fill in missing columns, normalise types and sort the papers once at load time.
+
+    Rows are ordered by 'Category' and then by 'Date' descending, so every
+    category occupies one contiguous, already date-sorted block of rows.
+
+    Parameters:
+    - df (pd.DataFrame): The DataFrame as read from the data source.
+
+    Returns:
+    - pd.DataFrame: The prepared DataFrame.
+    """
+    # Check for missing columns and add them with default values if necessary
+    missing_columns = [col for col in required_columns.keys() if col not in df.columns]
+    if missing_columns:
+        st.warning(f"The following required columns are missing in the CSV: {', '.join(missing_columns)}")
+        for col in missing_columns:
+            df[col] = required_columns[col]
+
+    # Empty link cells get the same '#' placeholder as missing link columns
+    for col in ['Link', 'PDF Link', 'HTML Link']:
+        df[col] = df[col].fillna('').replace('', '#')
+
+    # 'Date' is parsed by the readers; coerce anything that didn't match the format to NaT
+    if not pd.api.types.is_datetime64_any_dtype(df['Date']):
+        df['Date'] = pd.to_datetime(df['Date'], format=date_format, errors='coerce')
+
+    # Format the dates shown on the cards once, using the vectorised strftime
+    df['Date_Str'] = df['Date'].dt.strftime('%Y-%m-%d').fillna('N/A')
+
+    # Truncate the descriptions once here rather than for every card on every rerun
+    description = df['Description'].fillna('').astype(str)
+    words = description.str.split()
+    df['Description_Short'] = description.where(
+        words.str.len() <= max_description_words,
+        words.str[:max_description_words].str.join(' ') + '...'
+    )
+
+    # Escape the text inlined into the card HTML once instead of per card
+    for col in ['Title', 'Authors']:
+        df[col + '_H'] = df[col].fillna('').astype(str).map(html.escape)
+    df['Description_Short_H'] = df['Description_Short'].map(html.escape)
+
+    # Papers by the same group repeat the exact author string; store each one once as a category
+    if df['Authors'].nunique() < len(df) * 0.5:
+        for col in ['Authors', 'Authors_H']:
+            df[col] = df[col].astype('category')
+
+    # Use valid identifiers for the link columns so rows can be read as named tuples
+    df = df.rename(columns={'PDF Link': 'PDF_Link', 'HTML Link': 'HTML_Link'})
+
+    df['Category'] = df['Category'].astype('category')
+    df = df.sort_values(by=['Category', 'Date'], ascending=[True, False]).reset_index(drop=True)
+    return df
+
+# Columnar copy of arxiv_papers_category.csv, written once by convert_to_parquet.py
+parquet_path = 'arxiv_papers_category.parquet'
+
+# Datasets whose uncompressed column data exceeds this are converted to pandas column by column
+large_data_threshold = 200 * 1024 * 1024
+
+@st.cache_resource
+def load_data(file_path, modified_time):
+    """
+    Load the preprocessed Parquet dataset.
+
+    The Parquet file already stores 'Date' as datetime64 and 'Category' as a
+    category column, so no text parsing or type inference is needed.
+
+    The returned DataFrame is shared by all sessions and must not be modified in place.
+
+    Parameters:
+    - file_path (str): Path to the Parquet file.
+    - modified_time (float): The file's modification time, so a regenerated file is reloaded.
+
+    Returns:
+    - pd.DataFrame: The loaded DataFrame.
+    """
+    parquet_file = pq.ParquetFile(file_path)
+
+    # Only request the required columns the file has; prepare_data() fills in the rest
+    use_columns = [col for col in required_columns if col in parquet_file.schema_arrow.names]
+
+    # The file is compressed, so estimate the in-memory size from the row group metadata
+    metadata = parquet_file.metadata
+    uncompressed_size = sum(metadata.row_group(i).total_byte_size for i in range(metadata.num_row_groups))
+    if uncompressed_size > large_data_threshold:
+        # Release each Arrow column once it has been converted, so the full table and
+        # the full DataFrame are never held in memory at the same time
+        table = pq.read_table(file_path, columns=use_columns)
+        df = table.to_pandas(split_blocks=True, self_destruct=True)
+        del table  # The table is unusable after self_destruct
+    else:
+        df = pd.read_parquet(file_path, columns=use_columns, engine='pyarrow')
+    return prepare_data(df)
+
+def read_csv_with_arrow(data, column_types, include_columns):
+    """
+    Parse CSV text with PyArrow's multi-threaded CSV reader.
+
+    Parameters:
+    - data (str): Multi-line string with CSV data.
+    - column_types (dict): Arrow types for the columns present in the data.
+    - include_columns (list): The columns to read; all others are skipped.
+
+    Returns:
+    - pd.DataFrame: The parsed DataFrame with Arrow-backed string columns.
+    """
+    table = pv.read_csv(
+        pa.py_buffer(data.strip().encode('utf-8')),
+        read_options=pv.ReadOptions(use_threads=True),
+        parse_options=pv.ParseOptions(newlines_in_values=True),  # Descriptions span several lines
+        convert_options=pv.ConvertOptions(
+            column_types=column_types,
+            timestamp_parsers=[date_format],
+            include_columns=include_columns
+        )
+    )
+    return table.to_pandas(types_mapper={pa.string(): pd.StringDtype('pyarrow')}.get)
+
+# Version of the parsed frames persisted to disk by parse_data_from_text.
+# Bump it whenever read_csv_with_arrow, column_types or date_format change.
+text_cache_version = 1
+
+@st.cache_data(persist="disk")
+def parse_data_from_text(data, cache_version):
+    """
+    Parse CSV data from a multi-line string, without preparing it.
+
+    The result is persisted to disk, so after a server restart the parsed
+    DataFrame is unpickled instead of parsing the CSV text again. Streamlit's
+    cache key only covers this function's own source and arguments, so only the
+    raw parse is persisted: prepare_data() runs outside of this cache, and
+    cache_version stands in for the helpers and settings this function uses.
+
+    Parameters:
+    - data (str): Multi-line string with CSV data.
+    - cache_version (int): Version of the parsing code, normally text_cache_version.
+
+    Returns:
+    - pd.DataFrame: The parsed DataFrame.
+    """
+    # Only read the columns the app uses, so extra columns never reach the cached frame
+    header = next(csv.reader([data.strip().split('\n', 1)[0]]))
+    use_columns = [col for col in header if col in required_columns]
+    try:
+        df = read_csv_with_arrow(data, column_types, use_columns)
+    except pa.ArrowInvalid:
+        # Some dates don't match date_format; read them as text so they get coerced to NaT
+        df = read_csv_with_arrow(data, {**column_types, 'Date': pa.string()}, use_columns)
+    return df
+
 # Function to convert the multi-line string CSV to DataFrame
+@st.cache_resource
 def load_data_from_text(data):
     """
     Load CSV data from a multi-line string.
 
+    The returned DataFrame is shared by all sessions and must not be modified in place.
+
     Parameters:
     - data (str): Multi-line string with CSV data.
 
     Returns:
     - pd.DataFrame: The loaded DataFrame.
     """
-    from io import StringIO
-    df = pd.read_csv(StringIO(data))
-    return df
+    df = parse_data_from_text(data, text_cache_version)
+    return prepare_data(df)
 
 # Dictionary to hold the datasets
 data_sources = {
@@ -347,6 +539,11 @@ data_sources = {
     # "Research Data 3": data3
 }
 
+# Datasets that have a preprocessed Parquet copy on disk
+parquet_sources = {
+    "Research Day 1": parquet_path
+}
+
 # Sidebar for navigation
 st.sidebar.header("Navigation")
 selected_display = st.sidebar.selectbox(
@@ -355,66 +552,35 @@ selected_display = st.sidebar.selectbox(
     key="selected_file"
 )
 
-# Load the appropriate DataFrame from the selected dataset
-df = load_data_from_text(data_sources[selected_display])
-
 st.subheader(f"Displaying Data from {selected_display}")
 
-# Define the required columns with their default values
-required_columns = {
-    'Title': '',
-    'Authors': 'Unknown',
-    'Link': '#',
-    'Description': 'No description available',
-    'PDF Link': '#',        # Default to empty link if missing
-    'HTML Link': '#',       # Default to empty link if missing
-    'Category': 'Uncategorized',  # Default to 'Uncategorized' if missing
-    'Date': pd.NaT          # Default to NaT if missing
-}
-
-# Check for missing columns and add them with default values if necessary
-missing_columns = [col for col in required_columns.keys() if col not in df.columns]
-if missing_columns:
-    st.warning(f"The following required columns are missing in the CSV: {', '.join(missing_columns)}")
-    for col in missing_columns:
-        df[col] = required_columns[col]
+# Load the appropriate DataFrame from the selected dataset, preferring the Parquet copy
+source_path = parquet_sources.get(selected_display)
+if source_path and os.path.exists(source_path):
+    df = load_data(source_path, os.path.getmtime(source_path))
+else:
+    df = load_data_from_text(data_sources[selected_display])
 
-# Convert the 'Date' column to datetime.date
-df['Date'] = pd.to_datetime(df['Date'], format='%d-%m-%Y', errors='coerce').dt.date
+# The loaders hand out one shared frame per data source, so its id identifies the data.
+# Cached helpers take the frame as an unhashed _df and use this key instead of hashing it.
+data_key = id(df)
 
 # Handle any parsing errors in the 'Date' column
 if df['Date'].isnull().any():
     st.warning("Some dates could not be parsed and will be excluded from the selection.")
 
 # Example: Filter the DataFrame based on the 'Category' column
-filtered_df = df[
-    (df['Category'].notna()) &
-    (df['Category'] != 'Uncategorized') &
-    (df['Category'] != '')
-]
+# Compare integer category codes instead of the category strings of every row
+category_codes = df['Category'].cat.codes.to_numpy()
+excluded_codes = np.flatnonzero(df['Category'].cat.categories.isin(['Uncategorized', '']))
+mask = (category_codes >= 0) & ~np.isin(category_codes, excluded_codes)
+filtered_df = df.iloc[np.flatnonzero(mask)]
 
 # Inform the user if no data matches the criteria
 if filtered_df.empty:
     st.warning("No research papers found with specified categories.")
     st.stop()
 
-def truncate_description(text, max_words=200):
-    """
-    Truncate the description to a specified number of words.
-
-    Parameters:
-    - text (str): The original description text.
-    - max_words (int): The maximum number of words allowed.
-
-    Returns:
-    - str: The truncated description.
-    """
-    words = text.split()
-    if len(words) <= max_words:
-        return text
-    else:
-        return ' '.join(words[:max_words]) + '...'
-
 # Main title of the application
 st.title('📚 AI Research at a Glance: arXiv Paper Overviews')
 
@@ -422,6 +588,13 @@ st.title('📚 AI Research at a Glance: arXiv Paper Overviews')
 # Custom CSS for styling
 custom_css = """
 <style>
+/* Two-column grid holding the cards of the current page */
+.card-grid {
+    display: grid;
+    grid-template-columns: 1fr 1fr;
+    column-gap: 15px;
+}
+
 /* Style for the card container */
 .card-container {
     background-color: #f9f9f9;
@@ -496,40 +669,74 @@ custom_css = """
 
 st.markdown(custom_css, unsafe_allow_html=True)
 
-# Get the unique categories from the dataframe and sort them alphabetically
-categories = sorted(df['Category'].unique())
+@st.cache_data
+def get_categories(_df, data_key):
+    """
+    Get the categories of the DataFrame, sorted alphabetically.
 
-# Initialize session state to store the selected category
-if 'selected_category' not in st.session_state:
-    st.session_state.selected_category = categories[0]  # Default to the first category
+    Parameters:
+    - _df (pd.DataFrame): The prepared DataFrame with a category 'Category' column.
+    - data_key (int): Identifies the DataFrame in the cache key.
 
-# Initialize session state for pagination reset when category changes
-if 'current_page' not in st.session_state:
-    st.session_state.current_page = 0
+    Returns:
+    - list: The sorted category names.
+    """
+    # Read the categories array directly instead of scanning every row for unique values
+    return _df['Category'].cat.categories.sort_values().tolist()
 
-# Display all categories as buttons in the sidebar
+# Get the unique categories from the dataframe and sort them alphabetically
+categories = get_categories(df, data_key)
+
+# Keep the selected category and page in the URL so they survive reloads and can be bookmarked
+selected_category = st.query_params.get('cat', categories[0])  # Default to the first category
+if selected_category not in categories:
+    selected_category = categories[0]  # The category doesn't exist in this dataset
+try:
+    current_page = int(st.query_params.get('p', 0))
+except ValueError:
+    current_page = 0
+
+# Pick the category from a single selectbox in the sidebar
 st.sidebar.title("📂 Categories")
-for category in categories:
-    # Use a unique key for each button to prevent conflicts
-    if st.sidebar.button(category, key=category):
-        st.session_state.selected_category = category
-        st.session_state.current_page = 0  # Reset to first page when category changes
-        # Note: Automatic scrolling is omitted to prevent syntax errors
-
-# Retrieve the selected category
-selected_category = st.session_state.selected_category
+choice = st.sidebar.selectbox("Category", categories, index=categories.index(selected_category))
+if choice != selected_category:
+    st.query_params['cat'] = choice
+    st.query_params['p'] = '0'  # Reset to first page when category changes
+    selected_category = choice
+    current_page = 0
+
+@st.cache_data
+def build_category_index(_df, data_key):
+    """
+    Locate the block of rows belonging to each category in the sorted DataFrame.
 
-# Filter the dataframe based on the selected category
-filtered_df = df[df['Category'] == selected_category]
+    Parameters:
+    - _df (pd.DataFrame): The prepared DataFrame, sorted by 'Category' and 'Date'.
+    - data_key (int): Identifies the DataFrame in the cache key.
 
-# Check if any data exists after filtering
+    Returns:
+    - tuple: Arrays of start and end row positions, indexed by category code.
+    """
+    codes = _df['Category'].cat.codes.to_numpy()
+    codes = codes[:np.count_nonzero(codes >= 0)]  # Rows without a category are sorted last
+    category_codes = np.arange(len(_df['Category'].cat.categories))
+    starts = np.searchsorted(codes, category_codes, side='left')
+    ends = np.searchsorted(codes, category_codes, side='right')
+    return starts, ends
+
+# Slice out the selected category's papers, which are already sorted by 'Date'
+starts, ends = build_category_index(df, data_key)
+if selected_category in df['Category'].cat.categories:
+    cat_code = df['Category'].cat.categories.get_loc(selected_category)
+    filtered_df = df.iloc[starts[cat_code]:ends[cat_code]]
+else:
+    filtered_df = df.iloc[0:0]
+
+# Check if any data exists for the category
 if filtered_df.empty:
     st.warning(f"No records found for category: {selected_category}")
     st.stop()
 
-# Sort the filtered data by 'Date' descending
-filtered_df = filtered_df.sort_values(by='Date', ascending=False).reset_index(drop=True)
-
 # Define the number of cards per page
 cards_per_page = 20
 
@@ -537,76 +744,88 @@ cards_per_page = 20
 total_cards = len(filtered_df)
 total_pages = (total_cards - 1) // cards_per_page + 1
 
-# Function to get the current page's data
+# Keep a page number from the URL within range
+current_page = min(max(current_page, 0), total_pages - 1)
+
+# Write back any category or page that was normalised, so the URL matches what is shown
+if st.query_params.get('cat') != selected_category:
+    st.query_params['cat'] = selected_category
+if st.query_params.get('p') != str(current_page):
+    st.query_params['p'] = str(current_page)
+
+# Function to get the current page's data as one dict per card
 def get_page_data(df, page, cards_per_page):
     start_idx = page * cards_per_page
     end_idx = start_idx + cards_per_page
-    return df.iloc[start_idx:end_idx]
-
-# Get data for the current page
-current_page_data = get_page_data(filtered_df, st.session_state.current_page, cards_per_page)
-
-st.markdown(f"### 📂 Showing results for: **{selected_category}** (Page {st.session_state.current_page + 1} of {total_pages})")
-
-# Define number of columns per row (Reduced from 3 to 2 for wider cards)
-num_columns = 2
-rows = (len(current_page_data) + num_columns - 1) // num_columns  # Ceiling division
-
-for row in range(rows):
-    cols = st.columns(num_columns)
-    for col in range(num_columns):
-        idx = row * num_columns + col
-        if idx < len(current_page_data):
-            item = current_page_data.iloc[idx]
-            with cols[col]:
-                # Handle missing links gracefully
-                link = item.get('Link', '#')
-                pdf_link = item.get('PDF Link', '#')
-                html_link = item.get('HTML Link', '#')
-                
-                # Format the date
-                date_str = item['Date'].strftime('%Y-%m-%d') if pd.notnull(item['Date']) else 'N/A'
-                
-                # Truncate the description to 200 words
-                truncated_description = truncate_description(item['Description'], max_words=200)
-                
-                # Create the card HTML
-                card_html = f"""
-                <div class="card-container">
-                    <div>
-                        <div class="card-title">{item['Title']}</div>
-                        <div class="card-authors"><strong>Authors:</strong> {item['Authors']}</div>
-                        <div class="card-date"><strong>Date:</strong> {date_str}</div>
-                        <div class="card-description">{truncated_description}</div>
-                    </div>
-                    <div class="card-links">
-                        <a href="{link}" target="_blank">🔗 Visit Link</a>
-                        <a href="{pdf_link}" target="_blank">📄 PDF</a>
-                        <a href="{html_link}" target="_blank">🖥️ HTML</a>
-                    </div>
-                </div>
-                """
-                st.markdown(card_html, unsafe_allow_html=True)
+    return df.iloc[start_idx:end_idx].to_dict('records')
+
+def render_card(card):
+    """
+    Build the HTML for a single paper card.
+
+    Parameters:
+    - card (dict): One page record with the escaped and pre-formatted columns.
+
+    Returns:
+    - str: The card HTML, without surrounding blank lines.
+    """
+    # Missing link columns were filled with '#' at load time; the date and the
+    # 200-word description were formatted and escaped at load time too
+    card_html = f"""
+    <div class="card-container">
+        <div>
+            <div class="card-title">{card['Title_H']}</div>
+            <div class="card-authors"><strong>Authors:</strong> {card['Authors_H']}</div>
+            <div class="card-date"><strong>Date:</strong> {card['Date_Str']}</div>
+            <div class="card-description">{card['Description_Short_H']}</div>
+        </div>
+        <div class="card-links">
+            <a href="{card['Link']}" target="_blank">🔗 Visit Link</a>
+            <a href="{card['PDF_Link']}" target="_blank">📄 PDF</a>
+            <a href="{card['HTML_Link']}" target="_blank">🖥️ HTML</a>
+        </div>
+    </div>
+    """
+    # Strip the surrounding blank lines so the cards stay in one HTML block
+    return card_html.strip()
+
+# Function to get the current page's card HTML, memoized per page so repeat
+# visits to the same URL skip the pandas and string work. The DataFrame isn't
+# hashed (leading underscore); data_key, category and page identify the page.
+# The cards are sent in a single markdown call; the .card-grid CSS lays them out in two columns.
+@st.cache_data(max_entries=128)
+def get_page_html(_df, data_key, category, page, cards_per_page):
+    cards = get_page_data(_df, page, cards_per_page)
+    cards_html = ''.join(render_card(card) for card in cards)
+    return f'<div class="card-grid">{cards_html}</div>'
+
+st.markdown(f"### 📂 Showing results for: **{selected_category}** (Page {current_page + 1} of {total_pages})")
+
+# Get the HTML for the current page
+page_html = get_page_html(filtered_df, data_key, selected_category, current_page, cards_per_page)
+st.markdown(page_html, unsafe_allow_html=True)
 
 st.markdown("### Navigation")
 
 col1, col2, col3 = st.columns([1, 2, 1])
 
 with col1:
-    if st.session_state.current_page > 0:
+    if current_page > 0:
         if st.button("⬅️ Previous"):
-            st.session_state.current_page -= 1
+            st.query_params['p'] = str(current_page - 1)
+            st.rerun()  # The current page has already been rendered
 
 with col2:
     # You can add additional navigation info or leave it empty
     pass
 
 with col3:
-    if st.session_state.current_page < total_pages - 1:
+    if current_page < total_pages - 1:
         if st.button("Next ➡️"):
-            st.session_state.current_page += 1
+            st.query_params['p'] = str(current_page + 1)
+            st.rerun()  # The current page has already been rendered
 
-st.write(f"You are on page {st.session_state.current_page + 1} of {total_pages}.")
+st.write(f"You are on page {current_page + 1} of {total_pages}.")
 
 # Add a "Scroll to Top" Button
 # Place the button at the bottom-right corner of the page
@@ -0,0 +1,39 @@
+import pandas as pd
+
+csv_path = 'arxiv_papers_category.csv'
+parquet_path = 'arxiv_papers_category.parquet'
+
+# Text columns are read as strings, like app.py does, so empty cells stay '' instead of NaN
+string_columns = ['Title', 'Authors', 'Link', 'Description', 'PDF Link', 'HTML Link']
+link_columns = ['Link', 'PDF Link', 'HTML Link']
+
+def convert_to_parquet(csv_path, parquet_path):
+    """
+    Convert the arXiv papers CSV into a typed Parquet file for app.py.
+
+    Parameters:
+    - csv_path (str): Path to the source CSV file.
+    - parquet_path (str): Path of the Parquet file to write.
+
+    Returns:
+    - pd.DataFrame: The converted DataFrame.
+    """
+    df = pd.read_csv(csv_path, dtype={col: 'string' for col in string_columns}, keep_default_na=False)
+
+    # Empty links get the same '#' placeholder the app uses for missing links.
+    # Missing columns are left out here; app.py fills them in with defaults on load.
+    present_links = [col for col in link_columns if col in df.columns]
+    df[present_links] = df[present_links].replace('', '#')
+
+    # Persist the types so the app doesn't have to re-parse them on load
+    if 'Date' in df.columns:
+        df['Date'] = pd.to_datetime(df['Date'], format='%d-%m-%Y', errors='coerce')
+    if 'Category' in df.columns:
+        df['Category'] = df['Category'].astype('category')
+
+    df.to_parquet(parquet_path, engine='pyarrow', compression='zstd', index=False)
+    return df
+
+if __name__ == '__main__':
+    df = convert_to_parquet(csv_path, parquet_path)
+    print(f"Wrote {len(df)} rows to {parquet_path}")